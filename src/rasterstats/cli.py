@@ -1,15 +1,65 @@
+import itertools
 import logging
+import math
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
 import click
 import cligj
 import simplejson as json
 
-from rasterstats import gen_point_query, gen_zonal_stats
+from rasterstats import gen_point_query, gen_zonal_stats, zonal_stats
 from rasterstats._version import __version__ as version
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 SETTINGS = dict(help_option_names=["-h", "--help"])
 
 
+def dumps(obj):
+    """Serialize to a JSON string, using orjson when it is installed
+
+    orjson writes compact JSON and serializes NaN as null, whereas simplejson
+    separates items with ", " and writes NaN as-is.
+    """
+    if orjson is not None:
+        options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        return orjson.dumps(obj, option=options).decode("utf-8")
+    return json.dumps(obj)
+
+
+def echo_featurecollection(features):
+    """Write features as a GeoJSON FeatureCollection, one feature at a time
+
+    Avoids holding every output feature in memory before serializing.
+    """
+    # match the separators of the serializer used for each feature
+    if orjson is not None:
+        head, sep = '{"type":"FeatureCollection","features":[', ","
+    else:
+        head, sep = '{"type": "FeatureCollection", "features": [', ", "
+    click.echo(head, nl=False)
+    for i, feature in enumerate(features):
+        if i:
+            click.echo(sep, nl=False)
+        click.echo(dumps(feature), nl=False)
+    click.echo("]}")
+
+
+def echo_features(features, sequence, use_rs):
+    """Write features as a GeoJSON text sequence or a FeatureCollection"""
+    if sequence:
+        for feature in features:
+            if use_rs:
+                click.echo(b"\x1e", nl=False)
+            click.echo(dumps(feature))
+    else:
+        echo_featurecollection(features)
+
+
 @click.command(context_settings=SETTINGS)
 @cligj.features_in_arg
 @click.version_option(version=version, message="%(version)s")
@@ -23,6 +73,13 @@ SETTINGS = dict(help_option_names=["-h", "--help"])
 @click.option("--prefix", type=str, default="_")
 @click.option("--stats", type=str, default=None)
 @click.option("--sequence/--no-sequence", type=bool, default=False)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of worker processes to use",
+)
 @cligj.use_rs_opt
 def zonalstats(
     features,
@@ -36,6 +93,7 @@ def zonalstats(
     prefix,
     stats,
     sequence,
+    jobs,
     use_rs,
 ):
     """zonalstats generates summary statistics of geospatial raster datasets
@@ -61,9 +119,7 @@ def zonalstats(
         if "all" in [x.lower() for x in stats]:
             stats = "ALL"
 
-    zonal_results = gen_zonal_stats(
-        features,
-        raster,
+    zonal_kwargs = dict(
         all_touched=all_touched,
         band=band,
         categorical=categorical,
@@ -73,15 +129,19 @@ def zonalstats(
         geojson_out=True,
     )
 
-    if sequence:
-        for feature in zonal_results:
-            if use_rs:
-                click.echo(b"\x1e", nl=False)
-            click.echo(json.dumps(feature))
+    if jobs > 1:
+        # zones are independent; each worker handles a contiguous chunk of
+        # features with its own raster handle, and map() keeps their order
+        features = list(features)
+        size = math.ceil(len(features) / jobs) or 1
+        chunks = [features[i : i + size] for i in range(0, len(features), size)]
+        func = partial(zonal_stats, raster=raster, **zonal_kwargs)
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            zonal_results = itertools.chain.from_iterable(executor.map(func, chunks))
+            echo_features(zonal_results, sequence, use_rs)
     else:
-        click.echo(
-            json.dumps({"type": "FeatureCollection", "features": list(zonal_results)})
-        )
+        zonal_results = gen_zonal_stats(features, raster, **zonal_kwargs)
+        echo_features(zonal_results, sequence, use_rs)
 
 
 @click.command(context_settings=SETTINGS)
@@ -121,10 +181,4 @@ def pointquery(
         geojson_out=True,
     )
 
-    if sequence:
-        for feature in results:
-            if use_rs:
-                click.echo(b"\x1e", nl=False)
-            click.echo(json.dumps(feature))
-    else:
-        click.echo(json.dumps({"type": "FeatureCollection", "features": list(results)}))
+    echo_features(results, sequence, use_rs)
@@ -10,6 +10,7 @@ import rasterio
 from affine import Affine
 from fiona.errors import DriverError
 from rasterio.enums import MaskFlags
+from rasterio.io import DatasetReaderBase
 from rasterio.transform import guard_transform
 from shapely import wkb, wkt
 
@@ -62,6 +63,14 @@ def parse_feature(obj):
         elif gi["type"] == "Feature":
             return gi
 
+    # geojson-like python mapping
+    # checked before wkt/wkb so mappings skip two failed parse attempts
+    if isinstance(obj, Mapping):
+        if obj["type"] in geom_types:
+            return wrap_geom(obj)
+        elif obj["type"] == "Feature":
+            return obj
+
     # wkt
     try:
         shape = wkt.loads(obj)
@@ -76,7 +85,7 @@ def parse_feature(obj):
     except (ShapelyError, TypeError):
         pass
 
-    # geojson-like python mapping
+    # other subscriptable feature-like objects
     try:
         if obj["type"] in geom_types:
             return wrap_geom(obj)
@@ -115,7 +124,7 @@ def read_features(obj, layer=0):
                 # Single feature-like string
                 features_iter = [parse_feature(obj)]
     elif isinstance(obj, Mapping):
-        if "type" in obj and obj["type"] == "FeatureCollection":
+        if obj.get("type") == "FeatureCollection":
             features_iter = obj["features"]
         else:
             features_iter = [parse_feature(obj)]
@@ -172,6 +181,12 @@ def beyond_extent(window, shape):
     return wr_start < 0 or wc_start < 0 or wr_stop > shape[0] or wc_stop > shape[1]
 
 
+def outside_extent(window, shape):
+    """Checks if window references no pixels within the raster extent"""
+    (wr_start, wr_stop), (wc_start, wc_stop) = window
+    return wr_stop <= 0 or wc_stop <= 0 or wr_start >= shape[0] or wc_start >= shape[1]
+
+
 def boundless_array(arr, window, nodata, masked=False):
     dim3 = False
     if len(arr.shape) == 3:
@@ -240,8 +255,10 @@ class Raster:
     Parameters
     ----------
     raster: 2/3D array-like data source, required
-        Currently supports paths to rasterio-supported rasters and
-        numpy arrays with Affine transforms.
+        Currently supports paths to rasterio-supported rasters,
+        open rasterio datasets and numpy arrays with Affine transforms.
+        An open dataset is reused as-is and left open on exit, so one
+        handle (and its GDAL block cache) can serve many calls.
 
     affine: Affine object
         Maps row/col to coordinate reference system
@@ -262,6 +279,7 @@ class Raster:
     def __init__(self, raster, affine=None, nodata=None, band=1):
         self.array = None
         self.src = None
+        self.owns_src = False
 
         if isinstance(raster, np.ndarray):
             if affine is None:
@@ -271,7 +289,11 @@ class Raster:
             self.shape = raster.shape
             self.nodata = nodata
         else:
-            self.src = rasterio.open(raster, "r")
+            if isinstance(raster, DatasetReaderBase):
+                self.src = raster
+            else:
+                self.src = rasterio.open(raster, "r")
+                self.owns_src = True
             self.affine = guard_transform(self.src.transform)
             self.shape = (self.src.height, self.src.width)
             self.band = band
@@ -363,6 +385,6 @@ class Raster:
         return self
 
     def __exit__(self, *args):
-        if self.src is not None:
-            # close the rasterio reader
+        if self.src is not None and self.owns_src:
+            # close the rasterio reader we opened
             self.src.close()
@@ -6,13 +6,15 @@ import numpy as np
 from affine import Affine
 from shapely.geometry import shape
 
-from rasterstats.io import Raster, read_features
+from rasterstats.io import Raster, bounds_window, outside_extent, read_features
 from rasterstats.utils import (
     boxify_points,
     check_stats,
     get_percentile,
     key_assoc_val,
+    pixel_counts,
     rasterize_geom,
+    rasterize_point_boxes,
     remap_categories,
 )
 
@@ -77,8 +79,9 @@ def gen_zonal_stats(
     ----------
     vectors: path to an vector source or geo-like python objects
 
-    raster: ndarray or path to a GDAL raster source
+    raster: ndarray, path to a GDAL raster source or open rasterio dataset
         If ndarray is passed, the ``affine`` kwarg is required.
+        An open dataset is left open, so it can be reused across calls.
 
     layer: int or string, optional
         If `vectors` is a path to a fiona source,
@@ -151,6 +154,21 @@ def gen_zonal_stats(
         GeoJSON-like Feature as python dict
     """
     stats, run_count = check_stats(stats, categorical)
+    percentiles = [s for s in stats if s.startswith("percentile_")]
+    qs = [get_percentile(pctile) for pctile in percentiles]
+    # only extract each zone's valid pixels when a requested stat reads them
+    value_stats = ("min", "max", "median", "range")
+    needs_values = run_count or percentiles or any(s in stats for s in value_stats)
+    # zones entirely outside the raster can only yield empty stats, unless
+    # something needs the nodata-filled arrays
+    skip_outside = (
+        boundless
+        and "nodata" not in stats
+        and "nan" not in stats
+        and zone_func is None
+        and add_stats is None
+        and not raster_out
+    )
 
     # Handle 1.0 deprecations
     transform = kwargs.get("transform")
@@ -175,19 +193,39 @@ def gen_zonal_stats(
         band = band_num
 
     with Raster(raster, affine, nodata, band) as rast:
+        # only valid when the boundless fill is masked; rasterio fills with
+        # the file's nodata, or 0 when it has none
+        skip_outside = skip_outside and (
+            rast.array is not None
+            or (rast.src.nodata is not None and rast.src.nodata == rast.nodata)
+        )
         features_iter = read_features(vectors, layer)
         for _, feat in enumerate(features_iter):
             geom = shape(feat["geometry"])
 
-            if "Point" in geom.geom_type:
+            is_point = "Point" in geom.geom_type
+            if is_point:
                 geom = boxify_points(geom, rast)
 
             geom_bounds = tuple(geom.bounds)
 
+            if skip_outside and outside_extent(
+                bounds_window(geom_bounds, rast.affine), rast.shape
+            ):
+                # no overlap with the raster; skip the read and rasterization
+                feature_stats = {stat: None for stat in stats}
+                if "count" in stats:
+                    feature_stats["count"] = 0
+                yield format_output(feat, feature_stats, prefix, geojson_out)
+                continue
+
             fsrc = rast.read(bounds=geom_bounds, boundless=boundless)
 
             # rasterized geometry
-            rv_array = rasterize_geom(geom, like=fsrc, all_touched=all_touched)
+            if is_point:
+                rv_array = rasterize_point_boxes(geom, like=fsrc)
+            else:
+                rv_array = rasterize_geom(geom, like=fsrc, all_touched=all_touched)
 
             # nodata mask
             isnodata = fsrc.array == fsrc.nodata
@@ -223,25 +261,21 @@ def gen_zonal_stats(
                 if value is not None:
                     masked = value
 
-            if masked.compressed().size == 0:
+            # count the valid pixels, extracting them once if any stat needs them
+            if needs_values:
+                values = masked.compressed()
+                count = int(values.size)
+            else:
+                count = int(masked.count())
+
+            if count == 0:
                 # nothing here, fill with None and move on
                 feature_stats = {stat: None for stat in stats}
                 if "count" in stats:  # special case, zero makes sense here
                     feature_stats["count"] = 0
             else:
                 if run_count:
-                    keys, counts = np.unique(masked.compressed(), return_counts=True)
-                    try:
-                        pixel_count = dict(
-                            zip([k.item() for k in keys], [c.item() for c in counts])
-                        )
-                    except AttributeError:
-                        pixel_count = dict(
-                            zip(
-                                [np.asscalar(k) for k in keys],
-                                [np.asscalar(c) for c in counts],
-                            )
-                        )
+                    pixel_count = pixel_counts(values)
 
                 if categorical:
                     feature_stats = dict(pixel_count)
@@ -250,52 +284,60 @@ def gen_zonal_stats(
                 else:
                     feature_stats = {}
 
+                # mean, sum, std and count share a single reduction over the
+                # zone; the sum stays on the masked array so float accumulation
+                # order matches np.ma.sum/np.ma.mean on the same zone
+                if "mean" in stats or "sum" in stats or "std" in stats:
+                    total = masked.sum(dtype=accum_dtype)
+
+                # range is derived from the same min/max reductions
+                if "min" in stats or "range" in stats:
+                    vmin = float(values.min())
+                if "max" in stats or "range" in stats:
+                    vmax = float(values.max())
+
                 if "min" in stats:
-                    feature_stats["min"] = float(masked.min())
+                    feature_stats["min"] = vmin
                 if "max" in stats:
-                    feature_stats["max"] = float(masked.max())
+                    feature_stats["max"] = vmax
                 if "mean" in stats:
-                    feature_stats["mean"] = float(masked.mean(dtype=accum_dtype))
+                    feature_stats["mean"] = float(total) / count
                 if "count" in stats:
-                    feature_stats["count"] = int(masked.count())
+                    feature_stats["count"] = count
                 # optional
                 if "sum" in stats:
-                    feature_stats["sum"] = float(masked.sum(dtype=accum_dtype))
+                    feature_stats["sum"] = float(total)
                 if "std" in stats:
-                    feature_stats["std"] = float(masked.std())
+                    # reuse the zone mean rather than letting np.ma.std recompute
+                    # it; the float64 deviations are summed over the masked
+                    # array so the result is identical to masked.std()
+                    deviations = masked.astype("f8") - float(total) / count
+                    deviations *= deviations
+                    feature_stats["std"] = float(np.sqrt(deviations.sum() / count))
                 if "median" in stats:
-                    feature_stats["median"] = float(np.median(masked.compressed()))
+                    feature_stats["median"] = float(np.median(values))
                 if "majority" in stats:
                     feature_stats["majority"] = float(key_assoc_val(pixel_count, max))
                 if "minority" in stats:
                     feature_stats["minority"] = float(key_assoc_val(pixel_count, min))
                 if "unique" in stats:
-                    feature_stats["unique"] = len(list(pixel_count.keys()))
+                    feature_stats["unique"] = len(pixel_count)
                 if "range" in stats:
-                    try:
-                        rmin = feature_stats["min"]
-                    except KeyError:
-                        rmin = float(masked.min())
-                    try:
-                        rmax = feature_stats["max"]
-                    except KeyError:
-                        rmax = float(masked.max())
-                    feature_stats["range"] = rmax - rmin
-
-                for pctile in [s for s in stats if s.startswith("percentile_")]:
-                    q = get_percentile(pctile)
-                    pctarr = masked.compressed()
-                    feature_stats[pctile] = float(np.percentile(pctarr, q))
-
-            if "nodata" in stats or "nan" in stats:
-                featmasked = np.ma.MaskedArray(fsrc.array, mask=(~rv_array))
-
-                if "nodata" in stats:
-                    feature_stats["nodata"] = float((featmasked == fsrc.nodata).sum())
-                if "nan" in stats:
-                    feature_stats["nan"] = (
-                        float(np.isnan(featmasked).sum()) if has_nan else 0
-                    )
+                    feature_stats["range"] = vmax - vmin
+
+                for pctile, q in zip(percentiles, qs):
+                    feature_stats[pctile] = float(np.percentile(values, q))
+
+            # count pixels within the geometry with plain bool arrays
+            if "nodata" in stats:
+                isnodata_in_geom = rv_array & (fsrc.array == fsrc.nodata)
+                feature_stats["nodata"] = float(isnodata_in_geom.sum())
+            if "nan" in stats:
+                if has_nan:
+                    isnan_in_geom = rv_array & np.isnan(fsrc.array)
+                    feature_stats["nan"] = float(isnan_in_geom.sum())
+                else:
+                    feature_stats["nan"] = 0
 
             if add_stats is not None:
                 for stat_name, stat_func in add_stats.items():
@@ -316,18 +358,17 @@ def gen_zonal_stats(
                 feature_stats["mini_raster_affine"] = fsrc.affine
                 feature_stats["mini_raster_nodata"] = fsrc.nodata
 
-            if prefix is not None:
-                prefixed_feature_stats = {}
-                for key, val in feature_stats.items():
-                    newkey = f"{prefix}{key}"
-                    prefixed_feature_stats[newkey] = val
-                feature_stats = prefixed_feature_stats
-
-            if geojson_out:
-                for key, val in feature_stats.items():
-                    if "properties" not in feat:
-                        feat["properties"] = {}
-                    feat["properties"][key] = val
-                yield feat
-            else:
-                yield feature_stats
+            yield format_output(feat, feature_stats, prefix, geojson_out)
+
+
+def format_output(feat, feature_stats, prefix=None, geojson_out=False):
+    """Apply the key prefix and attach stats to the feature if requested"""
+    if prefix is not None:
+        feature_stats = {f"{prefix}{key}": val for key, val in feature_stats.items()}
+
+    if geojson_out:
+        if "properties" not in feat:
+            feat["properties"] = {}
+        feat["properties"].update(feature_stats)
+        return feat
+    return feature_stats
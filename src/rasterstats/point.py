@@ -125,8 +125,9 @@ def gen_point_query(
     ----------
     vectors: path to an vector source or geo-like python objects
 
-    raster: ndarray or path to a GDAL raster source
+    raster: ndarray, path to a GDAL raster source or open rasterio dataset
         If ndarray is passed, the `transform` kwarg is required.
+        An open dataset is left open, so it can be reused across calls.
 
     layer: int or string, optional
         If `vectors` is a path to a fiona source,
@@ -1,3 +1,7 @@
+import re
+from functools import lru_cache
+
+import numpy as np
 from rasterio import features
 from shapely.geometry import MultiPolygon, box
 
@@ -17,12 +21,21 @@ VALID_STATS = DEFAULT_STATS + [
 ]
 #  also percentile_{q} but that is handled as special case
 
+# hashed lookups for check_stats
+_VALID_STATS_SET = frozenset(VALID_STATS)
+_COUNT_TRIGGERS = frozenset(["majority", "minority", "unique"])
+
+_PERCENTILE_RE = re.compile(r"^percentile_(-?(?:\d+(?:\.\d*)?|\.\d+))$")
 
+
+@lru_cache(maxsize=64)
 def get_percentile(stat):
     if not stat.startswith("percentile_"):
         raise ValueError("must start with 'percentile_'")
-    qstr = stat.replace("percentile_", "")
-    q = float(qstr)
+    match = _PERCENTILE_RE.match(stat)
+    if match is None:
+        raise ValueError("percentile must be a number, e.g. 'percentile_90'")
+    q = float(match.group(1))
     if q > 100.0:
         raise ValueError("percentiles must be <= 100")
     if q < 0.0:
@@ -52,7 +65,9 @@ def rasterize_geom(geom, like, all_touched=False):
         all_touched=all_touched,
     )
 
-    return rv_array.astype(bool)
+    # burn value is 1 and fill is 0, so the uint8 buffer is a valid bool
+    # array; reinterpret it rather than copying
+    return rv_array.view(bool)
 
 
 def stats_to_csv(stats):
@@ -61,17 +76,11 @@ def stats_to_csv(stats):
 
     csv_fh = StringIO()
 
-    keys = set()
-    for stat in stats:
-        for key in list(stat.keys()):
-            keys.add(key)
-
-    fieldnames = sorted(list(keys), key=str)
+    fieldnames = sorted({key for stat in stats for key in stat}, key=str)
 
     csvwriter = csv.DictWriter(csv_fh, delimiter=",", fieldnames=fieldnames)
-    csvwriter.writerow({fn: fn for fn in fieldnames})
-    for row in stats:
-        csvwriter.writerow(row)
+    csvwriter.writeheader()
+    csvwriter.writerows(stats)
     contents = csv_fh.getvalue()
     csv_fh.close()
     return contents
@@ -92,36 +101,50 @@ def check_stats(stats, categorical):
     for x in stats:
         if x.startswith("percentile_"):
             get_percentile(x)
-        elif x not in VALID_STATS:
+        elif x not in _VALID_STATS_SET:
             raise ValueError(
                 "Stat `%s` not valid; " "must be one of \n %r" % (x, VALID_STATS)
             )
 
-    run_count = False
-    if categorical or "majority" in stats or "minority" in stats or "unique" in stats:
-        # run the counter once, only if needed
-        run_count = True
+    # run the counter once, only if needed
+    run_count = bool(categorical) or not _COUNT_TRIGGERS.isdisjoint(stats)
 
     return stats, run_count
 
 
 def remap_categories(category_map, stats):
-    def lookup(m, k):
-        """Dict lookup but returns original key if not found"""
-        try:
-            return m[k]
-        except KeyError:
-            return k
+    """Rename category keys, keeping the original key if it is not mapped"""
+    return {category_map.get(k, k): v for k, v in stats.items()}
 
-    return {lookup(category_map, k): v for k, v in stats.items()}
+
+def pixel_counts(arr):
+    """
+    Count the occurrences of each distinct value in a 1D array
+
+    Integer arrays with a compact value range are tallied with np.bincount
+    in linear time; anything else falls back to np.unique, which sorts.
+
+    Returns
+    -------
+    dict: python scalar value -> count, in ascending value order
+    """
+    if arr.size and arr.dtype.kind in "iu" and arr.dtype.itemsize <= 4:
+        vmin = int(arr.min())
+        vmax = int(arr.max())
+        if vmax - vmin <= max(arr.size, 256):
+            counts = np.bincount(arr.astype(np.intp) - vmin)
+            keys = np.flatnonzero(counts)
+            return dict(zip((keys + vmin).tolist(), counts[keys].tolist()))
+
+    keys, counts = np.unique(arr, return_counts=True)
+    return dict(zip(keys.tolist(), counts.tolist()))
 
 
 def key_assoc_val(d, func, exclude=None):
     """return the key associated with the value returned by func"""
-    vs = list(d.values())
-    ks = list(d.keys())
-    key = ks[vs.index(func(vs))]
-    return key
+    if exclude is not None:
+        return func((k for k in d if k != exclude), key=d.get)
+    return func(d, key=d.get)
 
 
 def boxify_points(geom, rast):
@@ -145,3 +168,28 @@ def boxify_points(geom, rast):
         geoms.append(box(*window_bounds(win, rast.affine)).buffer(buff))
 
     return MultiPolygon(geoms)
+
+
+def rasterize_point_boxes(geom, like):
+    """
+    Rasterize the cell boxes produced by ``boxify_points``
+
+    Each box lies strictly inside a single cell, so the mask is built by
+    indexing the cell under each box center directly instead of going
+    through GDALRasterize. Equivalent to ``rasterize_geom`` for these
+    boxes regardless of ``all_touched``.
+
+    Parameters
+    ----------
+    geom: MultiPolygon returned by boxify_points
+    like: raster object with desired shape and transform
+
+    Returns
+    -------
+    ndarray: boolean
+    """
+    rv_array = np.zeros(like.shape, dtype=bool)
+    cells = [like.index(*box.centroid.coords[0]) for box in geom.geoms]
+    rows, cols = zip(*cells)
+    rv_array[list(rows), list(cols)] = True
+    return rv_array
@@ -2,6 +2,7 @@ import json
 import os.path
 import warnings
 
+import pytest
 from click.testing import CliRunner
 
 from rasterstats.cli import pointquery, zonalstats
@@ -148,3 +149,67 @@ def test_cli_point_sequence_rs():
     )
     assert result.exit_code == 0
     assert result.output[0] == "\x1e"
+
+
+def test_cli_featurecollection_simplejson(monkeypatch):
+    import rasterstats.cli
+
+    monkeypatch.setattr(rasterstats.cli, "orjson", None)
+    raster = os.path.join(os.path.dirname(__file__), "data/slope.tif")
+    vector = os.path.join(os.path.dirname(__file__), "data/featurecollection.geojson")
+    runner = CliRunner()
+    result = runner.invoke(
+        zonalstats, [vector, "--raster", raster, "--stats", "mean", "--prefix", "test_"]
+    )
+    assert result.exit_code == 0
+    outdata = json.loads(result.output)
+    assert len(outdata["features"]) == 2
+    feature = outdata["features"][0]
+    assert round(feature["properties"]["test_mean"], 2) == 14.66
+    assert result.output.startswith('{"type": "FeatureCollection", "features": [')
+    assert '}, {"type": "Feature"' in result.output
+
+
+def test_cli_featurecollection_orjson():
+    pytest.importorskip("orjson")
+    raster = os.path.join(os.path.dirname(__file__), "data/slope_classes.tif")
+    vector = os.path.join(os.path.dirname(__file__), "data/featurecollection.geojson")
+    runner = CliRunner()
+    result = runner.invoke(
+        zonalstats, [vector, "--raster", raster, "--categorical", "--prefix", "test_"]
+    )
+    assert result.exit_code == 0
+    assert result.output.startswith('{"type":"FeatureCollection","features":[')
+    assert '},{"type":"Feature"' in result.output
+    outdata = json.loads(result.output)
+    assert len(outdata["features"]) == 2
+    properties = outdata["features"][0]["properties"]
+    # float category keys are prefixed into property names
+    assert "test_1.0" in properties
+
+
+def test_dumps_orjson_nan():
+    pytest.importorskip("orjson")
+    from rasterstats.cli import dumps
+
+    assert dumps({1.0: 2, 3: float("nan")}) == '{"1.0":2,"3":null}'
+
+
+def test_cli_jobs():
+    raster = os.path.join(os.path.dirname(__file__), "data/slope.tif")
+    vector = os.path.join(os.path.dirname(__file__), "data/featurecollection.geojson")
+    runner = CliRunner()
+    args = [vector, "--raster", raster, "--stats", "mean count", "--prefix", "test_"]
+    serial = runner.invoke(zonalstats, args)
+    parallel = runner.invoke(zonalstats, args + ["--jobs", "2"])
+    assert serial.exit_code == 0
+    assert parallel.exit_code == 0
+    assert json.loads(parallel.output) == json.loads(serial.output)
+
+
+def test_cli_jobs_invalid():
+    raster = os.path.join(os.path.dirname(__file__), "data/slope.tif")
+    vector = os.path.join(os.path.dirname(__file__), "data/featurecollection.geojson")
+    runner = CliRunner()
+    result = runner.invoke(zonalstats, [vector, "--raster", raster, "--jobs", "0"])
+    assert result.exit_code != 0
@@ -8,10 +8,11 @@ import rasterio
 from shapely.geometry import shape
 
 from rasterstats.io import (  # todo parse_feature
-    fiona_generator,
     Raster,
     boundless_array,
     bounds_window,
+    fiona_generator,
+    outside_extent,
     read_featurecollection,
     read_features,
     rowcol,
@@ -259,6 +260,14 @@ def test_rowcol():
         assert rowcol(x, y, src.transform, op=math.ceil) == (1, 1)
 
 
+def test_outside_extent():
+    shape = (10, 10)
+    assert not outside_extent(((0, 10), (0, 10)), shape)
+    assert not outside_extent(((-5, 1), (9, 20)), shape)
+    assert outside_extent(((-5, 0), (0, 10)), shape)
+    assert outside_extent(((0, 10), (10, 12)), shape)
+
+
 def test_Raster_index():
     x, y = 245114, 1000968
     with rasterio.open(raster) as src:
@@ -337,6 +346,20 @@ def test_Raster_context():
     assert r2.src.closed
 
 
+def test_Raster_open_dataset():
+    bounds = (244156, 1000258, 245114, 1000968)
+    with rasterio.open(raster) as src:
+        with Raster(src, band=1) as r1:
+            arr1 = r1.read(bounds).array
+        # a dataset opened by the caller is left open
+        assert not src.closed
+        with Raster(src, band=1) as r2:
+            arr2 = r2.read(bounds).array
+    assert np.array_equal(arr1, arr2)
+    with Raster(raster, band=1) as r3:
+        assert np.array_equal(arr1, r3.read(bounds).array)
+
+
 def test_geointerface():
     class MockGeo:
         def __init__(self, features):
@@ -383,7 +406,24 @@ def test_geodataframe():
     assert list(read_features(df))
 
 
+def test_parse_feature_subscriptable():
+    class FeatureLike:
+        # subscriptable, but not registered as a Mapping
+        def __init__(self, feature):
+            self.feature = feature
+
+        def __getitem__(self, key):
+            return self.feature[key]
+
+    feature = {
+        "type": "Feature",
+        "properties": {},
+        "geometry": {"type": "Point", "coordinates": [0, 0]},
+    }
+    obj = FeatureLike(feature)
+    assert next(read_features([obj])) is obj
+
+
 # TODO # io.parse_features on a feature-only geo_interface
 # TODO # io.parse_features on a feature-only geojson-like object
 # TODO # io.read_features on a feature-only
-# TODO # io.Raster.read() on an open rasterio dataset
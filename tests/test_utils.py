@@ -1,14 +1,20 @@
 import os
 import sys
 
+import numpy as np
 import pytest
-from shapely.geometry import LineString
+from shapely.geometry import LineString, MultiPoint
 
 from rasterstats import zonal_stats
+from rasterstats.io import Raster
 from rasterstats.utils import (
     VALID_STATS,
     boxify_points,
     get_percentile,
+    key_assoc_val,
+    pixel_counts,
+    rasterize_geom,
+    rasterize_point_boxes,
     remap_categories,
     stats_to_csv,
 )
@@ -55,6 +61,9 @@ def test_get_bad_percentile():
     with pytest.raises(ValueError):
         get_percentile("percentile_foobar")
 
+    with pytest.raises(ValueError):
+        get_percentile("percentile_nan")
+
 
 def test_remap_categories():
     feature_stats = {1: 22.343, 2: 54.34, 3: 987.5}
@@ -65,11 +74,44 @@ def test_remap_categories():
     assert 3 in new_stats.keys()
 
 
+def test_pixel_counts():
+    ints = np.array([5, -3, 5, 7, 5, -3], dtype="int16")
+    assert pixel_counts(ints) == {-3: 2, 5: 3, 7: 1}
+    assert list(pixel_counts(ints)) == [-3, 5, 7]
+
+    floats = np.array([1.0, 2.0, 1.0], dtype="float32")
+    assert pixel_counts(floats) == {1.0: 2, 2.0: 1}
+
+    # sparse integer values fall back to np.unique
+    sparse = np.array([0, 100000, 0], dtype="int32")
+    assert pixel_counts(sparse) == {0: 2, 100000: 1}
+
+
+def test_key_assoc_val():
+    pixel_count = {1.0: 3, 2.0: 5, 3.0: 5, 4.0: 1}
+    # ties resolve to the first key encountered
+    assert key_assoc_val(pixel_count, max) == 2.0
+    assert key_assoc_val(pixel_count, min) == 4.0
+    assert key_assoc_val(pixel_count, max, exclude=2.0) == 3.0
+
+
 def test_boxify_non_point():
     line = LineString([(0, 0), (1, 1)])
     with pytest.raises(ValueError):
         boxify_points(line, None)
 
 
+def test_rasterize_point_boxes():
+    points = MultiPoint([(245309, 1000064), (245500, 1000200), (245503, 1000201)])
+    with Raster(raster) as rast:
+        boxes = boxify_points(points, rast)
+        fsrc = rast.read(bounds=boxes.bounds)
+        mask = rasterize_point_boxes(boxes, like=fsrc)
+        assert mask.dtype == bool
+        for all_touched in (True, False):
+            expected = rasterize_geom(boxes, like=fsrc, all_touched=all_touched)
+            assert np.array_equal(mask, expected)
+
+
 # TODO # def test_boxify_multi_point
 # TODO # def test_boxify_point
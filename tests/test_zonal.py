@@ -31,6 +31,37 @@ def test_main():
     assert round(stats[0]["mean"], 2) == 14.66
 
 
+def test_outside_raster_without_nodata(tmp_path):
+    # boundless reads of a raster without nodata fill with 0, which is not
+    # masked, so zones outside the extent still count those cells
+    path = str(tmp_path / "no_nodata.tif")
+    profile = dict(
+        driver="GTiff",
+        width=4,
+        height=4,
+        count=1,
+        dtype="uint8",
+        transform=Affine(1, 0, 0, 0, -1, 4),
+    )
+    with rasterio.open(path, "w", **profile) as dst:
+        dst.write(np.full((1, 4, 4), 5, dtype="uint8"))
+
+    outside = Polygon([(10, 10), (12, 10), (12, 12), (10, 12)])
+    stats = zonal_stats([outside], path, stats="count min")
+    assert stats == [{"count": 4, "min": 0.0}]
+    stats = zonal_stats([outside], path, categorical=True)
+    assert stats == [{0: 4}]
+
+
+def test_open_dataset():
+    polygons = os.path.join(DATA, "polygons.shp")
+    with rasterio.open(raster) as src:
+        stats = zonal_stats(polygons, src)
+        stats2 = zonal_stats(polygons, src)
+        assert not src.closed
+    assert stats == stats2 == zonal_stats(polygons, raster)
+
+
 # remove after band_num alias is removed
 def test_band_alias():
     polygons = os.path.join(DATA, "polygons.shp")